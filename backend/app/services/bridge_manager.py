@@ -16,6 +16,9 @@ logger = logging.getLogger(__name__)
 
 BRIDGE_PREFIX = "bridge:"
 
+# Binary frames start with the terminal's channel id, 2 bytes big-endian
+CHANNEL_HEADER = struct.Struct(">H")
+
 
 def is_bridge(container_id: str) -> bool:
     return container_id.startswith(BRIDGE_PREFIX)
@@ -86,8 +89,7 @@ class BridgeConnection:
         await self.ws.send_text(json.dumps(msg))
 
     async def send_binary(self, channel_id: int, data: bytes) -> None:
-        header = struct.pack(">H", channel_id)
-        await self.ws.send_bytes(header + data)
+        await self.ws.send_bytes(CHANNEL_HEADER.pack(channel_id) + data)
 
     async def request(self, msg: dict, timeout: float = 10.0) -> dict:
         """Send a JSON message and await a correlated response."""
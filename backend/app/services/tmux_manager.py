@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+import re
 from datetime import UTC, datetime
 
 from ..config import config
@@ -15,6 +16,12 @@ logger = logging.getLogger(__name__)
 HOST_CONTAINER_ID = "host"
 LOCAL_CONTAINER_ID = "local"
 
+# One match per line of the list-sessions / list-windows -F formats below
+_SESSION_LINE_RE = re.compile(r"^([^|\n]*)\|[^|\n]*\|([^|\n]*)\|([^|\n]*)$", re.M)
+_WINDOW_FIELDS = r"\|".join([r"([^|\n]*)"] * 7 + [r"([^\n]*)"])  # last: pane_status
+_WINDOW_LINE_RE = re.compile(rf"^{_WINDOW_FIELDS}$", re.M)
+_SESSION_WINDOW_LINE_RE = re.compile(rf"^([^|\n]*)\|{_WINDOW_FIELDS}$", re.M)
+
 
 def _is_host(container_id: str) -> bool:
     return container_id == HOST_CONTAINER_ID
@@ -37,6 +44,22 @@ def make_session_id(container_id: str, session_name: str) -> str:
     return hashlib.md5(f"{container_id}:{session_name}".encode()).hexdigest()[:12]
 
 
+def _window_from_fields(
+    index: str, name: str, active: str, panes: str,
+    bell: str, activity: str, command: str, pane_status: str,
+) -> dict:
+    return {
+        "index": int(index) if index.isdigit() else 0,
+        "name": name,
+        "active": active == "1",
+        "panes": int(panes) if panes.isdigit() else 1,
+        "bell": bell == "1",
+        "activity": activity == "1",
+        "command": command,
+        "pane_status": pane_status,
+    }
+
+
 class TmuxManager:
     """Manages tmux sessions inside Docker containers via ``docker exec``,
     or locally on the host when container_id == "host"."""
@@ -117,27 +140,7 @@ class TmuxManager:
                 "#{window_index}|#{window_name}|#{window_active}|#{window_panes}|#{window_bell_flag}|#{window_activity_flag}|#{pane_current_command}|#{@pane_status}",
             ],
         )
-        windows = []
-        for line in output.strip().splitlines():
-            line = line.strip()
-            if not line or "|" not in line:
-                continue
-            parts = line.split("|")
-            if len(parts) < 4:
-                continue
-            windows.append(
-                {
-                    "index": int(parts[0]) if parts[0].isdigit() else 0,
-                    "name": parts[1],
-                    "active": parts[2] == "1",
-                    "panes": int(parts[3]) if parts[3].isdigit() else 1,
-                    "bell": parts[4] == "1" if len(parts) > 4 else False,
-                    "activity": parts[5] == "1" if len(parts) > 5 else False,
-                    "command": parts[6] if len(parts) > 6 else "",
-                    "pane_status": parts[7] if len(parts) > 7 else "",
-                }
-            )
-        return windows
+        return [_window_from_fields(*m.groups()) for m in _WINDOW_LINE_RE.finditer(output)]
 
     async def _list_all_windows(self, container_id: str) -> dict[str, list[dict]]:
         """List all windows across all sessions in a single tmux command.
@@ -155,25 +158,8 @@ class TmuxManager:
             ],
         )
         windows_by_session: dict[str, list[dict]] = {}
-        for line in output.strip().splitlines():
-            line = line.strip()
-            if not line or "|" not in line:
-                continue
-            parts = line.split("|")
-            if len(parts) < 5:
-                continue
-            session_name = parts[0]
-            window = {
-                "index": int(parts[1]) if parts[1].isdigit() else 0,
-                "name": parts[2],
-                "active": parts[3] == "1",
-                "panes": int(parts[4]) if parts[4].isdigit() else 1,
-                "bell": parts[5] == "1" if len(parts) > 5 else False,
-                "activity": parts[6] == "1" if len(parts) > 6 else False,
-                "command": parts[7] if len(parts) > 7 else "",
-                "pane_status": parts[8] if len(parts) > 8 else "",
-            }
-            windows_by_session.setdefault(session_name, []).append(window)
+        for m in _SESSION_WINDOW_LINE_RE.finditer(output):
+            windows_by_session.setdefault(m[1], []).append(_window_from_fields(*m.groups()[1:]))
         return windows_by_session
 
     async def list_sessions(self, container_id: str) -> list[dict]:
@@ -204,20 +190,14 @@ class TmuxManager:
         all_windows = await self._list_all_windows(container_id)
 
         sessions = []
-        for line in output.strip().splitlines():
-            line = line.strip()
-            if not line or "|" not in line:
-                continue
-            parts = line.split("|")
-            if len(parts) < 4:
-                continue
-            name = parts[0]
+        for m in _SESSION_LINE_RE.finditer(output):
+            name = m[1]
             try:
-                created_ts = int(parts[2])
+                created_ts = int(m[2])
                 created = datetime.fromtimestamp(created_ts, tz=UTC).isoformat()
             except (ValueError, OSError):
                 created = datetime.now(UTC).isoformat()
-            attached = parts[3] == "1"
+            attached = m[3] == "1"
 
             windows = all_windows.get(name, [])
 
@@ -9,12 +9,11 @@ from __future__ import annotations
 
 import json
 import logging
-import struct
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from .. import store
-from ..services.bridge_manager import BridgeManager
+from ..services.bridge_manager import CHANNEL_HEADER, BridgeManager
 from ..services.debug_log import DebugLog
 
 logger = logging.getLogger(__name__)
@@ -95,7 +94,7 @@ async def bridge_ws(websocket: WebSocket):
                 data = message["bytes"]
                 if len(data) < 2:
                     continue
-                channel_id = struct.unpack(">H", data[:2])[0]
+                (channel_id,) = CHANNEL_HEADER.unpack_from(data)
                 payload = data[2:]
                 user_ws = conn.get_terminal_ws(channel_id)
                 if user_ws:
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import os
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
@@ -12,6 +16,10 @@ from app.main import app
 from app.services.docker_manager import DockerManager
 from app.services.tmux_manager import TmuxManager
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from pathlib import Path
+
 FAKE_CONTAINER_CREATED = {
     "id": "abc123def4",
     "full_id": "abc123def456789000000000000000000000000000000000000000000000000",
@@ -26,16 +34,88 @@ FAKE_CONTAINER_RUNNING = {
     "status": "running",
 }
 
+SAMPLE_TEMPLATE = MappingProxyType({
+    "id": "tpl-test-template",
+    "name": "test-template",
+    "type": "dockerfile",
+    "content": "FROM ubuntu:22.04\nRUN apt-get update",
+    "buildArgs": {},
+    "defaultVolumes": ["/data:/data"],
+    "defaultEnv": {"FOO": "bar"},
+    "createdAt": "2024-01-01T00:00:00+00:00",
+    "updatedAt": "2024-01-01T00:00:00+00:00",
+})
 
-@pytest.fixture(autouse=True)
-def isolated_data_dir(tmp_path):
-    """Point the store at a fresh temp directory for each test."""
+
+# Public manager API, computed once so mocks don't re-introspect the classes.
+_DM_SPEC = [name for name in dir(DockerManager) if not name.startswith("_")]
+_TM_SPEC = [name for name in dir(TmuxManager) if not name.startswith("_")]
+
+
+def make_mock_dm() -> MagicMock:
+    """Build a DockerManager mock with default successful behaviour."""
+    dm = MagicMock(spec_set=_DM_SPEC)
+    dm.build_image = AsyncMock(return_value="sha256:abc123")
+    dm.create_container = AsyncMock(return_value=FAKE_CONTAINER_CREATED)
+    dm.start_container = AsyncMock()
+    dm.get_container = AsyncMock(return_value=FAKE_CONTAINER_RUNNING)
+    dm.list_containers = AsyncMock(return_value=[])
+    dm.stop_container = AsyncMock()
+    dm.remove_container = AsyncMock()
+    dm.rename_container = AsyncMock()
+    dm.put_file = AsyncMock()
+    dm.exec_command = AsyncMock(return_value="")
+    return dm
+
+
+def make_mock_tm() -> MagicMock:
+    """Build a TmuxManager mock with default successful behaviour."""
+    tm = MagicMock(spec_set=_TM_SPEC)
+    tm.list_sessions = AsyncMock(return_value=[])
+    tm.ensure_session = AsyncMock()
+    tm.create_session = AsyncMock()
+    return tm
+
+
+def install_template(template: Mapping[str, Any]) -> None:
+    """Write a prebuilt template record into the current store."""
+    store._write_json(store.templates_dir() / f"{template['id']}.json", dict(template))
+
+
+def install_settings(overrides: Mapping[str, Any]) -> None:
+    """Write the default settings merged with *overrides* in a single write."""
+    store._write_json(store.settings_path(), {**store._DEFAULT_SETTINGS, **overrides})
+
+
+@contextmanager
+def use_data_dir(path: Path) -> Iterator[Path]:
+    """Point the store at *path* for the duration of the block."""
     original = config.data_dir
-    config.data_dir = str(tmp_path / "data")
+    config.data_dir = str(path)
     os.makedirs(config.data_path / "templates", exist_ok=True)
     os.makedirs(config.data_path / "containers", exist_ok=True)
-    yield tmp_path / "data"
-    config.data_dir = original
+    try:
+        yield path
+    finally:
+        config.data_dir = original
+
+
+@pytest.fixture(scope="session", autouse=True)
+def session_data_dir(tmp_path_factory):
+    """Keep the store off the real data dir for anything outside a single test.
+
+    Module/session fixtures and the app lifespan run before ``isolated_data_dir``
+    takes effect, so they would otherwise read and write ``config.data_dir``.
+    """
+    with use_data_dir(tmp_path_factory.mktemp("session") / "data") as path:
+        yield path
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path):
+    """Point the store at a fresh temp directory for each test."""
+    with use_data_dir(tmp_path / "data") as path:
+        yield path
 
 
 @pytest.fixture(autouse=True)
@@ -48,50 +128,70 @@ def reset_singletons():
     TmuxManager._instance = None
 
 
+@pytest.fixture(scope="module")
+def docker_get():
+    """Patch DockerManager.get once per module; tests pick its result via mock_dm or side_effect."""
+    with patch.object(DockerManager, "get") as get:
+        yield get
+
+
+@pytest.fixture(scope="module")
+def tmux_get():
+    """Patch TmuxManager.get once per module; tests pick its result via mock_tm."""
+    with patch.object(TmuxManager, "get") as get:
+        yield get
+
+
 @pytest.fixture
-def mock_dm():
+def mock_dm(docker_get):
     """Mock DockerManager with default successful behaviour."""
-    dm = MagicMock(spec=DockerManager)
-    dm.build_image = AsyncMock(return_value="sha256:abc123")
-    dm.create_container = AsyncMock(return_value=FAKE_CONTAINER_CREATED)
-    dm.start_container = AsyncMock()
-    dm.get_container = AsyncMock(return_value=FAKE_CONTAINER_RUNNING)
-    dm.list_containers = AsyncMock(return_value=[])
-    dm.stop_container = AsyncMock()
-    dm.remove_container = AsyncMock()
-    dm.rename_container = AsyncMock()
-    return dm
+    dm = make_mock_dm()
+    docker_get.return_value = dm
+    yield dm
+    docker_get.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
-def mock_tm():
+def mock_tm(tmux_get):
     """Mock TmuxManager with default successful behaviour."""
-    tm = MagicMock(spec=TmuxManager)
-    tm.list_sessions = AsyncMock(return_value=[])
-    tm.ensure_session = AsyncMock()
-    tm.create_session = AsyncMock()
-    return tm
+    tm = make_mock_tm()
+    tmux_get.return_value = tm
+    yield tm
+    tmux_get.reset_mock(return_value=True, side_effect=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_template():
-    """Create a template in the store and return its data."""
-    return store.create_template({
-        "name": "test-template",
-        "type": "dockerfile",
-        "content": "FROM ubuntu:22.04\nRUN apt-get update",
-        "buildArgs": {},
-        "defaultVolumes": ["/data:/data"],
-        "defaultEnv": {"FOO": "bar"},
-    })
+    """Read-only sample template record, shared by the whole session."""
+    return SAMPLE_TEMPLATE
+
+
+@pytest.fixture(autouse=True)
+def _register_sample_template(isolated_data_dir, sample_template):
+    """Make the sample template available in each test's store."""
+    install_template(sample_template)
+
+
+@pytest.fixture(scope="module")
+def app_client(docker_get, tmux_get):
+    """One TestClient (and app lifespan) shared by all tests in a module."""
+    with TestClient(app, raise_server_exceptions=False) as c:
+        yield c
 
 
 @pytest.fixture
-def client(mock_dm, mock_tm):
+def client(app_client, mock_dm, mock_tm):
     """TestClient with mocked Docker and Tmux managers."""
-    with (
-        patch.object(DockerManager, "get", return_value=mock_dm),
-        patch.object(TmuxManager, "get", return_value=mock_tm),
-        TestClient(app, raise_server_exceptions=False) as c,
-    ):
+    app_client.cookies.clear()
+    return app_client
+
+
+@pytest.fixture
+async def async_client(mock_dm, mock_tm):
+    """Async client that calls the ASGI app in-process, without TestClient's portal.
+
+    The app lifespan is not run; tests using this only need the route handlers.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
         yield c
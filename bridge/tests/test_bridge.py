@@ -2,25 +2,50 @@
 
 from __future__ import annotations
 
-import struct
+from tmuxdeck_bridge.bridge import _SESSION_LINE_RE, Bridge, _session_id
+from tmuxdeck_bridge.config import BridgeConfig
 
-import pytest
+_CFG = BridgeConfig(url="ws://localhost:8000/ws/bridge", token="test")
 
-from tmuxdeck_bridge.bridge import Bridge
-from tmuxdeck_bridge.config import BridgeConfig
+# Binary frames: [2-byte channel_id][payload]
+_KNOWN_CHANNEL = 42
+_KNOWN_PAYLOAD = b"hello terminal"
+_KNOWN_CHANNEL_FRAME = _KNOWN_CHANNEL.to_bytes(2, "big") + _KNOWN_PAYLOAD
+_UNKNOWN_CHANNEL_FRAME = (999).to_bytes(2, "big") + b"data"
+_SHORT_FRAME = b"\x00"
 
 
 def test_bridge_init():
-    cfg = BridgeConfig(url="ws://localhost:8000/ws/bridge", token="test")
-    bridge = Bridge(cfg)
+    bridge = Bridge(_CFG)
     assert bridge._running is False
     assert bridge._terminals == {}
     assert bridge._ws is None
 
 
-def test_build_tmux_cmd_no_socket():
-    cfg = BridgeConfig(url="ws://localhost:8000/ws/bridge", token="test")
+def test_configured_sources_cached():
+    cfg = BridgeConfig(
+        url="ws://localhost:8000/ws/bridge",
+        token="test",
+        host_tmux_socket="/tmp/tmux/default",
+    )
     bridge = Bridge(cfg)
+    sources = bridge._configured_sources()
+    assert sources == ("local", "host")
+    assert bridge._configured_sources() is sources
+
+    bridge._host_socket_broken = True
+    bridge._sources_cache = None
+    assert bridge._configured_sources() == ("local",)
+
+
+def test_session_id_is_stable():
+    # IDs are persisted by clients; this must keep matching md5("bridge:<source>:<name>")[:12]
+    assert _session_id("local", "main") == "7a5dcc51f0ec"
+    assert _session_id("docker:abc123", "main") != _session_id("local", "main")
+
+
+def test_build_tmux_cmd_no_socket():
+    bridge = Bridge(_CFG)
     cmd = bridge._build_tmux_cmd(["tmux", "list-sessions"])
     assert cmd == ["tmux", "list-sessions"]
 
@@ -47,10 +72,8 @@ def test_build_tmux_cmd_non_tmux():
     assert cmd == ["echo", "hello"]
 
 
-@pytest.mark.asyncio
 async def test_handle_binary_routes_to_terminal():
-    cfg = BridgeConfig(url="ws://localhost:8000/ws/bridge", token="test")
-    bridge = Bridge(cfg)
+    bridge = Bridge(_CFG)
 
     # Create a mock terminal
     written_data = []
@@ -59,32 +82,219 @@ async def test_handle_binary_routes_to_terminal():
         def write(self, data):
             written_data.append(data)
 
-    channel_id = 42
-    bridge._terminals[channel_id] = MockTerminal()
+    bridge._terminals[_KNOWN_CHANNEL] = MockTerminal()
 
-    # Simulate binary frame: [2-byte channel_id][payload]
-    payload = b"hello terminal"
-    frame = struct.pack(">H", channel_id) + payload
-    await bridge._handle_binary(frame)
+    await bridge._handle_binary(_KNOWN_CHANNEL_FRAME)
 
-    assert written_data == [payload]
+    assert written_data == [_KNOWN_PAYLOAD]
 
 
-@pytest.mark.asyncio
 async def test_handle_binary_ignores_unknown_channel():
-    cfg = BridgeConfig(url="ws://localhost:8000/ws/bridge", token="test")
-    bridge = Bridge(cfg)
+    bridge = Bridge(_CFG)
 
-    frame = struct.pack(">H", 999) + b"data"
     # Should not raise
-    await bridge._handle_binary(frame)
+    await bridge._handle_binary(_UNKNOWN_CHANNEL_FRAME)
 
 
-@pytest.mark.asyncio
 async def test_handle_binary_short_frame():
-    cfg = BridgeConfig(url="ws://localhost:8000/ws/bridge", token="test")
-    bridge = Bridge(cfg)
+    bridge = Bridge(_CFG)
 
     # Frame too short (< 2 bytes)
-    await bridge._handle_binary(b"\x00")
+    await bridge._handle_binary(_SHORT_FRAME)
     # Should not raise
+
+
+async def test_docker_client_reused_across_reports(monkeypatch):
+    from tmuxdeck_bridge import bridge as bridge_mod
+
+    created = []
+
+    class FakeContainers:
+        fail = False
+
+        def list(self, filters):
+            if FakeContainers.fail:
+                raise OSError("docker went away")
+            return []
+
+    class FakeClient:
+        def __init__(self, base_url):
+            created.append(base_url)
+            self.containers = FakeContainers()
+
+        def close(self):
+            pass
+
+    fake_docker = type("FakeDocker", (), {"DockerClient": FakeClient})
+    monkeypatch.setattr(bridge_mod, "docker_lib", fake_docker)
+    cfg = BridgeConfig(
+        url="ws://localhost:8000/ws/bridge", token="test", docker_socket="/var/run/docker.sock",
+    )
+    bridge = Bridge(cfg)
+
+    await bridge._collect_docker_sessions()
+    await bridge._collect_docker_sessions()
+    assert created == ["unix:///var/run/docker.sock"]
+
+    FakeContainers.fail = True
+    assert await bridge._collect_docker_sessions() == []
+    assert bridge._docker_client is None
+
+
+async def test_identical_session_report_skipped():
+    bridge = Bridge(_CFG)
+    sent = []
+
+    class MockWs:
+        async def send(self, data, text=False):
+            sent.append(data)
+
+    ws = MockWs()
+    sessions = [{"id": _session_id("local", "main"), "name": "main", "source": "local"}]
+
+    await bridge._send_sessions(ws, sessions)
+    await bridge._send_sessions(ws, list(sessions))
+    assert len(sent) == 1
+
+    await bridge._send_sessions(ws, [])
+    assert len(sent) == 2
+
+
+async def test_unchanged_session_report_resent_periodically():
+    from tmuxdeck_bridge.bridge import _REPORT_RESEND_EVERY
+
+    bridge = Bridge(_CFG)
+    sent = []
+
+    class MockWs:
+        async def send(self, data, text=False):
+            sent.append(data)
+
+    for _ in range(2 * _REPORT_RESEND_EVERY):
+        await bridge._send_sessions(MockWs(), [])
+    assert len(sent) == 2
+
+
+def test_session_line_regex_skips_malformed_lines():
+    stdout = b"main|2|1700000000|1\ngarbage\n\nwork|1|1700000001|0\n"
+    parsed = [(m[1], m[2], m[3]) for m in _SESSION_LINE_RE.finditer(stdout)]
+    assert parsed == [(b"main", b"1700000000", b"1"), (b"work", b"1700000001", b"0")]
+
+
+async def test_broken_host_socket_recovers(tmp_path):
+    import socket
+
+    sock_path = str(tmp_path / "tmux.sock")
+    cfg = BridgeConfig(
+        url="ws://localhost:8000/ws/bridge", token="test", local=False, host_tmux_socket=sock_path,
+    )
+    bridge = Bridge(cfg)
+    bridge._host_socket_broken = True
+
+    async def fake_list(extra_args, source="local"):
+        return [{"id": _session_id(source, "main"), "name": "main", "source": source}]
+
+    bridge._list_tmux_sessions = fake_list
+
+    # Nothing listening yet: host stays disabled
+    assert await bridge._collect_sessions() == []
+    assert bridge._configured_sources() == ()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(sock_path)
+    server.listen()
+    try:
+        sessions = await bridge._collect_sessions()
+    finally:
+        server.close()
+    assert [s["name"] for s in sessions] == ["main"]
+    assert bridge._host_socket_broken is False
+    assert bridge._configured_sources() == ("host",)
+
+
+def test_container_tmux_dir_probe(tmp_path, monkeypatch):
+    from tmuxdeck_bridge import bridge as bridge_mod
+
+    container_id = "3f1c0ffee" * 7
+    proc = tmp_path / "proc"
+    (proc / "123" / "root" / "tmp").mkdir(parents=True)
+    (proc / "123" / "cgroup").write_text(f"0::/system.slice/docker-{container_id}.scope\n")
+    (proc / "456" / "root" / "tmp").mkdir(parents=True)
+    (proc / "456" / "cgroup").write_text("0::/\n")
+    monkeypatch.setattr(bridge_mod, "_PROC", str(proc))
+    attrs = {"Id": container_id, "State": {"Pid": 123}, "Config": {"Env": ["PATH=/usr/bin"]}}
+
+    assert bridge_mod._container_has_tmux_dir(attrs) is False
+    (proc / "123" / "root" / "tmp" / "tmux-1000").mkdir()
+    assert bridge_mod._container_has_tmux_dir(attrs) is True
+    # Undecidable from here: fall back to exec
+    assert bridge_mod._container_has_tmux_dir({**attrs, "State": {"Pid": 999}}) is None
+    assert bridge_mod._container_has_tmux_dir(
+        {**attrs, "Config": {"Env": ["TMUX_TMPDIR=/run"]}},
+    ) is None
+    # Same PID, but some other process of ours (the bridge's own PID namespace)
+    assert bridge_mod._container_has_tmux_dir({**attrs, "State": {"Pid": 456}}) is None
+
+
+async def test_tmux_cmd_via_control_only_with_target():
+    bridge = Bridge(_CFG)
+    lines = []
+
+    class FakeControl:
+        async def command(self, line, timeout=5):
+            lines.append(line)
+            return b"out\n"
+
+    bridge._tmux_controls["local"] = FakeControl()
+
+    def via_control(cmd):
+        return bridge._tmux_cmd_via_control(cmd, "local")
+
+    assert await via_control(["tmux", "select-window", "-t", "main:1"]) == ("out\n", None)
+    assert await via_control(["tmux", "set-option", "-g", "mouse", "off"]) == ("out\n", None)
+    assert lines == ["'select-window' '-t' 'main:1'", "'set-option' '-g' 'mouse' 'off'"]
+    # Would act on the control session, or can't be sent as one line
+    assert await via_control(["tmux", "kill-session"]) is None
+    assert await via_control(["tmux", "attach-session", "-t", "main"]) is None
+    assert await via_control(["tmux", "send-keys", "-t", "main", "a\nb"]) is None
+    assert await via_control(["bash", "-c", "true"]) is None
+    assert await bridge._tmux_cmd_via_control(
+        ["tmux", "select-window", "-t", "x"], "host",
+    ) is None  # no control client for this source
+    assert len(lines) == 2
+
+
+async def test_tmux_control_start_failure_not_retried(monkeypatch):
+    from tmuxdeck_bridge import bridge as bridge_mod
+    from tmuxdeck_bridge.tmux_control import TmuxControlError
+
+    cfg = BridgeConfig(url="ws://localhost:8000/ws/bridge", token="test", tmux_control=True)
+    bridge = Bridge(cfg)
+    starts = []
+
+    class FailingControl:
+        def __init__(self, extra_args):
+            pass
+
+        async def start(self):
+            starts.append(1)
+            raise TmuxControlError("no server")
+
+    async def fake_query(extra_args, args, source):
+        return b"main|1|1700000000|0\n"
+
+    async def fake_windows(extra_args, source):
+        return {}
+
+    monkeypatch.setattr(bridge_mod, "TmuxControlClient", FailingControl)
+    bridge._tmux_query = fake_query
+    bridge._list_tmux_windows = fake_windows
+
+    for _ in range(3):
+        assert [s["name"] for s in await bridge._list_tmux_sessions([])] == ["main"]
+    assert len(starts) == 1
+    assert "local" not in bridge._tmux_controls
+    # A new connection gives it another go
+    bridge._tmux_control_failed.clear()
+    await bridge._list_tmux_sessions([])
+    assert len(starts) == 2
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import sys
 
+import pytest
+
 from tmuxdeck_bridge.config import BridgeConfig, parse_config
 
 
@@ -19,6 +21,7 @@ def test_bridge_config_defaults():
     assert cfg.session_report_interval == 5.0
     assert cfg.reconnect_min == 5.0
     assert cfg.reconnect_max == 60.0
+    assert cfg.tmux_control is False
 
 
 def test_bridge_config_custom():
@@ -40,68 +43,71 @@ def test_bridge_config_custom():
     assert cfg.docker_label == "tmuxdeck=true"
 
 
-def test_parse_config_basic(monkeypatch):
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        ["tmuxdeck-bridge", "--url", "ws://host:8000/ws/bridge", "--token", "abc123"],
-    )
-    cfg = parse_config()
-    assert cfg.url == "ws://host:8000/ws/bridge"
-    assert cfg.token == "abc123"
-    assert cfg.local is True
+_BASE_ARGV = ["tmuxdeck-bridge", "--url", "ws://host:8000/ws/bridge", "--token", "abc123"]
 
 
-def test_parse_config_no_local(monkeypatch):
-    monkeypatch.setattr(
-        sys,
-        "argv",
+@pytest.mark.parametrize(("argv", "env", "expected"), [
+    pytest.param(
+        _BASE_ARGV,
+        {},
+        {
+            "url": "ws://host:8000/ws/bridge", "token": "abc123",
+            "local": True, "tmux_control": False,
+        },
+        id="basic",
+    ),
+    pytest.param(
+        [*_BASE_ARGV, "--no-local"],
+        {},
+        {"local": False},
+        id="no_local",
+    ),
+    pytest.param(
+        [*_BASE_ARGV, "--tmux-control"],
+        {},
+        {"tmux_control": True},
+        id="tmux_control",
+    ),
+    pytest.param(
         [
-            "tmuxdeck-bridge",
-            "--url", "ws://host:8000/ws/bridge",
-            "--token", "abc123",
-            "--no-local",
-        ],
-    )
-    cfg = parse_config()
-    assert cfg.local is False
-
-
-def test_parse_config_all_options(monkeypatch):
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        [
-            "tmuxdeck-bridge",
-            "--url", "ws://host:8000/ws/bridge",
-            "--token", "abc123",
+            *_BASE_ARGV,
             "--name", "prod-server",
             "--host-tmux-socket", "/tmp/tmux/default",
             "--docker-socket", "/var/run/docker.sock",
             "--docker-label", "env=prod",
             "--report-interval", "10",
         ],
-    )
-    cfg = parse_config()
-    assert cfg.name == "prod-server"
-    assert cfg.host_tmux_socket == "/tmp/tmux/default"
-    assert cfg.docker_socket == "/var/run/docker.sock"
-    assert cfg.docker_label == "env=prod"
-    assert cfg.session_report_interval == 10.0
-
-
-def test_parse_config_env_vars(monkeypatch):
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        ["tmuxdeck-bridge", "--url", "ws://host:8000/ws/bridge", "--token", "abc123"],
-    )
-    monkeypatch.setenv("BRIDGE_NAME", "env-server")
-    monkeypatch.setenv("HOST_TMUX_SOCKET", "/tmp/tmux-env/default")
-    monkeypatch.setenv("DOCKER_SOCKET", "/run/docker.sock")
-    monkeypatch.setenv("DOCKER_LABEL", "app=test")
+        {},
+        {
+            "name": "prod-server",
+            "host_tmux_socket": "/tmp/tmux/default",
+            "docker_socket": "/var/run/docker.sock",
+            "docker_label": "env=prod",
+            "session_report_interval": 10.0,
+        },
+        id="all_options",
+    ),
+    pytest.param(
+        _BASE_ARGV,
+        {
+            "BRIDGE_NAME": "env-server",
+            "HOST_TMUX_SOCKET": "/tmp/tmux-env/default",
+            "DOCKER_SOCKET": "/run/docker.sock",
+            "DOCKER_LABEL": "app=test",
+        },
+        {
+            "name": "env-server",
+            "host_tmux_socket": "/tmp/tmux-env/default",
+            "docker_socket": "/run/docker.sock",
+            "docker_label": "app=test",
+        },
+        id="env_vars",
+    ),
+])
+def test_parse_config(monkeypatch, argv, env, expected):
+    monkeypatch.setattr(sys, "argv", argv)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
     cfg = parse_config()
-    assert cfg.name == "env-server"
-    assert cfg.host_tmux_socket == "/tmp/tmux-env/default"
-    assert cfg.docker_socket == "/run/docker.sock"
-    assert cfg.docker_label == "app=test"
+    for attr, value in expected.items():
+        assert getattr(cfg, attr) == value
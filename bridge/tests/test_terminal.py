@@ -0,0 +1,99 @@
+"""Tests for PTY terminal sessions."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+
+from tmuxdeck_bridge.terminal import TerminalSession
+
+
+def _session_on_pipe():
+    read_fd, write_fd = os.pipe()
+    terminal = TerminalSession(1, ws=None, cmd=[])
+    terminal._master_fd = write_fd
+    return terminal, read_fd
+
+
+async def test_writes_coalesced_into_one_flush():
+    terminal, read_fd = _session_on_pipe()
+    os.set_blocking(read_fd, False)
+    try:
+        terminal.write(b"ab")
+        terminal.write(memoryview(b"xcd")[1:])
+        assert terminal._wbuf == b"abcd"
+        await asyncio.sleep(0.01)
+        assert os.read(read_fd, 100) == b"abcd"
+        assert terminal._flush_handle is None
+    finally:
+        os.close(read_fd)
+        os.close(terminal._master_fd)
+
+
+async def test_high_water_flushes_immediately(monkeypatch):
+    monkeypatch.setattr("tmuxdeck_bridge.terminal._WRITE_HIGH_WATER", 8)
+    terminal, read_fd = _session_on_pipe()
+    try:
+        terminal.write(b"0123456789")
+        assert not terminal._wbuf
+        assert terminal._flush_handle is None
+        assert os.read(read_fd, 100) == b"0123456789"
+    finally:
+        os.close(read_fd)
+        os.close(terminal._master_fd)
+
+
+async def test_full_pty_input_waits_for_writable():
+    terminal, read_fd = _session_on_pipe()
+    os.set_blocking(terminal._master_fd, False)
+    os.set_blocking(read_fd, False)
+    data = os.urandom(1024 * 1024)  # more than the pipe can hold
+    received = bytearray()
+    try:
+        terminal.write(data)
+        await asyncio.sleep(0.01)
+        assert terminal._waiting_writable
+        async with asyncio.timeout(5):
+            while len(received) < len(data):
+                try:
+                    received.extend(os.read(read_fd, 65536))
+                except BlockingIOError:
+                    pass
+                await asyncio.sleep(0)
+        assert received == data
+        assert not terminal._waiting_writable
+    finally:
+        os.close(read_fd)
+        os.close(terminal._master_fd)
+
+
+async def test_busy_read_loop_yields_between_frames():
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+
+    class FakeWS:
+        """send never suspends and keeps the PTY readable, like a fast link."""
+
+        frames = 0
+
+        async def send(self, frame):
+            self.frames += 1
+            if self.frames < 5:
+                os.write(write_fd, b"more")
+            else:
+                os.close(write_fd)
+
+    ws = FakeWS()
+    terminal = TerminalSession(1, ws=ws, cmd=[])
+    terminal._master_fd = read_fd
+    try:
+        os.write(write_fd, b"first")
+        reader = asyncio.create_task(terminal._read_loop())
+        await asyncio.sleep(0)  # reader reads and sends its first frame
+        await asyncio.sleep(0)
+        assert ws.frames < 5
+        async with asyncio.timeout(5):
+            await reader
+        assert ws.frames == 5
+    finally:
+        os.close(read_fd)
@@ -0,0 +1,130 @@
+"""Tests for the tmux control-mode client."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from tmuxdeck_bridge.tmux_control import (
+    TmuxCommandError,
+    TmuxControlClient,
+    TmuxControlError,
+    quote_args,
+)
+
+
+def _client_reading(data: bytes) -> TmuxControlClient:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    client = TmuxControlClient([])
+    client._proc = SimpleNamespace(stdout=reader)
+    return client
+
+
+async def test_reply_skips_notifications():
+    client = _client_reading(
+        b"%sessions-changed\n"
+        b"%begin 1700000000 12 1\n"
+        b"main|2|1700000000|1\n"
+        b"%end 1700000000 12 1\n"
+    )
+    assert await client._read_reply() == b"main|2|1700000000|1\n"
+
+
+async def test_reply_error_raises():
+    client = _client_reading(
+        b"%begin 1700000000 13 1\n"
+        b"unknown command: nope\n"
+        b"%error 1700000000 13 1\n"
+    )
+    with pytest.raises(TmuxCommandError, match="unknown command"):
+        await client._read_reply()
+
+
+async def test_reply_eof_raises():
+    client = _client_reading(b"%begin 1700000000 14 1\n")
+    with pytest.raises(TmuxControlError):
+        await client._read_reply()
+
+
+def test_quote_args():
+    assert quote_args(["send-keys", "-t", "main:0", "it's $HOME; x", ""]) == (
+        "'send-keys' '-t' 'main:0' 'it'\\''s $HOME; x' ''"
+    )
+
+
+async def test_attached_session_tracked_from_notifications():
+    client = _client_reading(
+        b"%session-changed $1 my work\n"
+        b"%session-renamed $2 other\n"
+        b"%begin 1700000000 15 1\n"
+        b"%end 1700000000 15 1\n"
+        b"%session-renamed $1 renamed\n"
+        b"%begin 1700000000 16 1\n"
+        b"%end 1700000000 16 1\n"
+    )
+    await client._read_reply()
+    assert client.session_name == "my work"
+    await client._read_reply()
+    assert client.session_name == "renamed"
+
+
+async def test_timed_out_command_detaches_client():
+    """A reply left unread must never be taken as the next command's."""
+    reader = asyncio.StreamReader()
+    stdin = SimpleNamespace(write=lambda data: None, close=lambda: None)
+
+    async def drain():
+        pass
+
+    stdin.drain = drain
+    client = TmuxControlClient([])
+    client._proc = SimpleNamespace(stdin=stdin, stdout=reader, returncode=None)
+    with pytest.raises(TimeoutError):
+        await client.command("'capture-pane' '-p'", timeout=0.01)
+    # The late reply to the first command arrives now
+    reader.feed_data(b"%begin 1 17 1\nstale\n%end 1 17 1\n")
+    with pytest.raises(TmuxControlError, match="not running"):
+        await client.command("'display-message' '-p' 'x'")
+
+
+async def test_reply_ends_only_on_matching_guard():
+    client = _client_reading(
+        b"%begin 1700000000 18 1\n"
+        b"%end 1 2 0\n"
+        b"%error 1700000000 19 1\n"
+        b"%end 1700000000 18 1\n"
+    )
+    assert await client._read_reply() == b"%end 1 2 0\n%error 1700000000 19 1\n"
+
+
+@pytest.mark.skipif(shutil.which("tmux") is None, reason="needs tmux")
+async def test_capture_pane_with_end_line_in_output(tmp_path):
+    sock = str(tmp_path / "tmux.sock")  # private server, killed below
+    env = {k: v for k, v in os.environ.items() if k != "TMUX"}
+
+    def tmux(*args):
+        return subprocess.run(
+            ["tmux", "-S", sock, *args], env=env, capture_output=True, text=True,
+        )
+
+    tmux("new-session", "-d", "-s", "t", "printf '%s\\n' '%end 1 2 0' after; exec sleep 60")
+    client = TmuxControlClient(["-S", sock])
+    try:
+        async with asyncio.timeout(5):
+            while "after" not in tmux("capture-pane", "-p", "-t", "t").stdout:
+                await asyncio.sleep(0.05)
+        await client.start()
+        output = await client.command(quote_args(["capture-pane", "-p", "-t", "t"]))
+        assert output.startswith(b"%end 1 2 0\nafter\n")
+        # The next reply is its own, not the tail of the capture
+        assert await client.command(quote_args(["display-message", "-p", "next"])) == b"next\n"
+    finally:
+        await client.close()
+        tmux("kill-server")
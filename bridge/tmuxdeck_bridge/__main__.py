@@ -4,8 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import signal
 
+try:
+    import uvloop
+except ImportError:  # optional speedup; plain asyncio works too
+    uvloop = None
+
 
 def main() -> None:
     logging.basicConfig(
@@ -25,27 +31,27 @@ def main() -> None:
         main_task = asyncio.current_task()
         shutdown_requested = False
 
-        def _on_signal():
+        def _on_signal(sig: signal.Signals):
             nonlocal shutdown_requested
             if shutdown_requested:
                 logging.warning("Forced shutdown")
-                import os
                 os._exit(1)
             shutdown_requested = True
-            logging.info("Shutting down...")
+            logging.info("Received %s, shutting down...", sig.name)
             bridge.stop()
             main_task.cancel()
 
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, _on_signal)
+            loop.add_signal_handler(sig, _on_signal, sig)
 
         try:
             await bridge.run()
         except asyncio.CancelledError:
             pass
 
+    run = uvloop.run if uvloop is not None else asyncio.run
     try:
-        asyncio.run(_run())
+        run(_run())
     except KeyboardInterrupt:
         pass
 
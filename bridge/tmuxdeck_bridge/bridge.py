@@ -4,23 +4,161 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import glob
+import functools
 import hashlib
-import json
 import logging
 import os
+import re
 import socket
-import struct
+import stat
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from pathlib import Path
 
+import orjson
 import websockets
 
+try:
+    import docker as docker_lib
+except ImportError:  # only needed for --docker-socket discovery
+    docker_lib = None
+
 from .config import BridgeConfig
 from .terminal import TerminalSession
+from .tmux_control import (
+    TmuxCommandError,
+    TmuxControlClient,
+    TmuxControlError,
+    quote_args,
+)
 
 logger = logging.getLogger(__name__)
 
+_SESSION_FORMAT = "#{session_name}|#{session_windows}|#{session_created}|#{session_attached}"
+_WINDOW_FORMAT = (
+    "#{session_name}|#{window_index}|#{window_name}|#{window_active}|#{window_panes}"
+    "|#{window_bell_flag}|#{window_activity_flag}|#{pane_current_command}|#{@pane_status}"
+)
+
+# tmux_cmd commands that may run on the control client, given an explicit
+# -t target or -g/-s (global/server option). Without one, tmux would apply
+# them to whichever session the control client happens to be attached to.
+_CONTROL_TMUX_CMDS = frozenset({
+    "capture-pane", "copy-mode", "kill-session", "new-window",
+    "rename-session", "select-window", "send-keys", "set-option",
+})
+_TARGET_FLAGS = frozenset({"-t", "-g", "-s"})
+
+# One match per line of the list-sessions / list-windows -F formats above
+_SESSION_LINE_RE = re.compile(rb"^([^|\n]*)\|[^|\n]*\|([^|\n]*)\|([^|\n]*)$", re.M)
+_WINDOW_LINE_RE = re.compile(
+    rb"^([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)"
+    rb"\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^\n]*)$",
+    re.M,
+)
+
+_PROC = "/proc"
+
+_PONG_MSG = orjson.dumps({"type": "pong"})  # constant reply, encoded once
+
+# Unchanged session reports are skipped, but every Nth one is sent anyway
+# so the backend's copy cannot drift indefinitely.
+_REPORT_RESEND_EVERY = 10
+
+
+async def _send_json(ws: websockets.ClientConnection, msg: dict) -> None:
+    """Send a JSON control message as a text frame.
+
+    orjson encodes straight to UTF-8 bytes; text=True keeps it a text frame,
+    which the backend relies on to tell control messages from terminal data.
+    """
+    await ws.send(orjson.dumps(msg), text=True)
+
+
+@functools.lru_cache(maxsize=4096)
+def _session_id(source: str, name: str) -> str:
+    """Deterministic session ID: md5("bridge:<source>:<name>")[:12].
+
+    Clients persist these IDs (sidebar order, fold state), so the scheme
+    must not change. Cached because the same sessions are reported every
+    interval; the LRU bound drops sessions that have gone away.
+    """
+    key = f"bridge:{source}:{name}".encode()
+    return hashlib.md5(key, usedforsecurity=False).hexdigest()[:12]
+
+
+def _entry_kind(entry: os.DirEntry) -> str:
+    try:
+        if entry.is_dir():
+            return "dir"
+        return "socket" if stat.S_ISSOCK(entry.stat().st_mode) else "file"
+    except OSError:
+        return "stat-error"
+
+
+def _scan_tmux_dirs() -> list[tuple[str, str]]:
+    """Find tmux socket dirs and their default sockets as (path, kind) pairs.
+
+    Covers /tmp/tmux-*/ (with its "default" socket) and /run/tmux/*/ in one
+    scandir pass per directory.
+    """
+    found: list[tuple[str, str]] = []
+    try:
+        with os.scandir("/tmp") as it:
+            tmux_dirs = [e for e in it if e.name.startswith("tmux-") and e.is_dir()]
+    except OSError:
+        tmux_dirs = []
+    for d in tmux_dirs:
+        found.append((d.path + "/", "dir"))
+        try:
+            with os.scandir(d.path) as sub:
+                found.extend((e.path, _entry_kind(e)) for e in sub if e.name == "default")
+        except OSError:
+            pass
+    try:
+        with os.scandir("/run/tmux") as it:
+            found.extend((e.path + "/", "dir") for e in it if e.is_dir())
+    except OSError:
+        pass
+    return sorted(found)
+
+
+def _container_has_tmux_dir(attrs: dict) -> bool | None:
+    """Check a container's /tmp for tmux-* socket dirs through /proc/<pid>/root.
+
+    State.Pid is in the host's PID namespace, so /proc/<pid> is only used
+    if its cgroup names the container. Returns None when that cannot be
+    decided (no /proc access, another PID namespace, or TMUX_TMPDIR moves
+    the sockets), so callers exec as usual. Blocking: reads /proc.
+    """
+    pid = attrs.get("State", {}).get("Pid")
+    container_id = attrs.get("Id", "")
+    env = attrs.get("Config", {}).get("Env") or []
+    if not pid or not container_id or any(e.startswith("TMUX_TMPDIR=") for e in env):
+        return None
+    try:
+        with open(f"{_PROC}/{pid}/cgroup") as f:
+            if container_id not in f.read():
+                return None  # not that container's process (e.g. PID collision)
+        with os.scandir(f"{_PROC}/{pid}/root/tmp") as it:
+            return any(e.name.startswith("tmux-") for e in it)
+    except OSError:
+        return None
+
+
+def _exec_list_sessions(container) -> bytes:
+    """Run tmux list-sessions in a container (blocking; for a worker thread).
+
+    Returns b"" without an exec when the container has no tmux socket dir,
+    i.e. no tmux server.
+    """
+    if _container_has_tmux_dir(container.attrs) is False:
+        return b""
+    result = container.exec_run(["tmux", "list-sessions", "-F", _SESSION_FORMAT], demux=True)
+    if result.exit_code != 0:
+        return b""
+    return result.output[0] or b""
+
 
 class Bridge:
     """Bridge agent that connects to TmuxDeck backend via WebSocket."""
@@ -31,38 +169,61 @@ class Bridge:
         self._terminals: dict[int, TerminalSession] = {}  # channel_id → session
         self._running = False
         self._host_socket_broken = False
+        self._sources_cache: tuple[str, ...] | None = None  # reset when _host_socket_broken flips
+        self._docker_client = None  # docker.DockerClient, created on first use
+        # Wakes session_reporter early; set by list_sessions requests
+        self._report_event = asyncio.Event()
+        self._last_report_digest: bytes | None = None  # of the last sent payload
+        self._reports_skipped = 0  # consecutive unchanged reports not sent
+        # Control-mode tmux clients for local/host, running while they have sessions
+        self._tmux_controls: dict[str, TmuxControlClient] = {}
+        self._tmux_control_failed: set[str] = set()  # sources; retried on reconnect
         # Session source lookup caches (rebuilt on each _collect_sessions)
         self._name_to_source: dict[str, str] = {}  # session_name → source
         self._id_to_source: dict[str, str] = {}  # session_id → source
-
-    def _configured_sources(self) -> list[str]:
-        """Return the list of configured session sources.
+        # JSON control message type → handler
+        self._json_handlers: dict[str, Callable[[dict], Awaitable[None]]] = {
+            "attach": self._handle_attach,
+            "detach": self._handle_detach,
+            "resize": self._handle_resize,
+            "tmux_cmd": self._handle_tmux_cmd,
+            "list_sessions": self._handle_list_sessions,
+            "file_read": self._handle_file_read,
+            "ping": self._handle_ping,
+        }
+
+    def _configured_sources(self) -> tuple[str, ...]:
+        """Return the configured session sources.
 
         Only includes sources that map 1:1 to sidebar containers.
         Docker sources are excluded here because they are discovered
         dynamically as "docker:<container_id>" during session collection.
+        The result is cached; clear _sources_cache when the inputs change.
         """
-        sources = []
-        if self.config.local:
-            sources.append("local")
-        if self.config.host_tmux_socket and not self._host_socket_broken:
-            sources.append("host")
-        return sources
-
-    def _test_socket_connectable(self, path: str) -> bool:
+        if self._sources_cache is None:
+            sources = []
+            if self.config.local:
+                sources.append("local")
+            if self.config.host_tmux_socket and not self._host_socket_broken:
+                sources.append("host")
+            self._sources_cache = tuple(sources)
+        return self._sources_cache
+
+    async def _test_socket_connectable(self, path: str) -> bool:
         """Try to connect to a Unix domain socket. Returns True if connectable."""
-        import socket as _socket
-
         try:
-            sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
-            sock.settimeout(2)
-            sock.connect(path)
-            sock.close()
-            return True
-        except (OSError, _socket.error):
+            async with asyncio.timeout(2):
+                _, writer = await asyncio.open_unix_connection(path)
+        except (OSError, TimeoutError):
             return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
 
-    def _log_startup_info(self) -> None:
+    async def _log_startup_info(self) -> None:
         """Log configured sources and scan for tmux sockets."""
         logger.info("=== Bridge startup diagnostics ===")
         logger.info("Bridge name: %s", self.config.name)
@@ -88,18 +249,19 @@ class Bridge:
                 exists = True
             if exists:
                 logger.info("Host tmux socket EXISTS: %s", sock_path)
-                if self._test_socket_connectable(str(sock_path)):
+                if await self._test_socket_connectable(str(sock_path)):
                     logger.info("Host tmux socket CONNECTABLE: %s", sock_path)
                 else:
                     logger.warning(
                         "Host tmux socket EXISTS but NOT CONNECTABLE: %s — "
                         "this typically happens on Docker Desktop (macOS/Windows) where "
                         "Unix domain sockets cannot cross the VM boundary. "
-                        "The host source will be disabled. "
+                        "The host source will be disabled until it becomes connectable. "
                         "Run the bridge natively to use host tmux sockets.",
                         sock_path,
                     )
                     self._host_socket_broken = True
+                    self._sources_cache = None
             else:
                 logger.warning("Host tmux socket NOT FOUND: %s", sock_path)
                 # Check parent directory
@@ -110,28 +272,19 @@ class Bridge:
                     parent_exists = False
                 if parent_exists:
                     try:
-                        contents = list(parent.iterdir())
+                        contents = os.listdir(parent)  # names only, no Path per entry
                     except OSError:
                         contents = []
-                    logger.info("  Parent dir %s contains: %s",
-                                parent, [f.name for f in contents])
+                    logger.info("  Parent dir %s contains: %s", parent, contents)
                 else:
                     logger.warning("  Parent dir %s does NOT exist", parent)
 
         # Scan for tmux sockets in common locations
-        found_sockets: list[str] = []
-        for pattern in ["/tmp/tmux-*/", "/tmp/tmux-host/", "/run/tmux/*/",
-                        "/tmp/tmux-*/default", "/tmp/tmux-host/default"]:
-            found_sockets.extend(glob.glob(pattern))
+        found_sockets = _scan_tmux_dirs()
         if found_sockets:
             logger.info("Tmux sockets/dirs found on filesystem:")
-            for s in sorted(set(found_sockets)):
-                p = Path(s)
-                try:
-                    kind = "socket" if p.is_socket() else "dir" if p.is_dir() else "file"
-                except OSError:
-                    kind = "stat-error"
-                logger.info("  %s [%s]", s, kind)
+            for path, kind in found_sockets:
+                logger.info("  %s [%s]", path, kind)
         else:
             logger.info("No tmux sockets found in /tmp/tmux-* or /run/tmux/")
 
@@ -149,11 +302,18 @@ class Bridge:
         logger.info("=== End diagnostics ===")
 
     async def run(self) -> None:
-        """Auto-reconnect loop with exponential backoff."""
-        self._log_startup_info()
+        """Run the bridge until stopped, then release tmux control clients."""
+        await self._log_startup_info()
         self._running = True
-        delay = self.config.reconnect_min
+        try:
+            await self._reconnect_loop()
+        finally:
+            for source in list(self._tmux_controls):
+                await self._close_tmux_control(source)
 
+    async def _reconnect_loop(self) -> None:
+        """Auto-reconnect loop with exponential backoff."""
+        delay = self.config.reconnect_min
         while self._running:
             try:
                 logger.info("Connecting to %s ...", self.config.url)
@@ -162,10 +322,12 @@ class Bridge:
                     max_size=32 * 1024 * 1024,
                     ping_interval=30,
                     ping_timeout=10,
+                    compression=None,  # PTY traffic: deflate costs CPU per frame
                     family=socket.AF_INET6 if self.config.ipv6 else socket.AF_INET,
                 ) as ws:
                     self._ws = ws
                     delay = self.config.reconnect_min  # reset on success
+                    self._tmux_control_failed.clear()
 
                     if not await self._authenticate(ws):
                         logger.error("Authentication failed, stopping")
@@ -196,14 +358,14 @@ class Bridge:
 
     async def _authenticate(self, ws: websockets.ClientConnection) -> bool:
         """Send auth message and wait for response."""
-        await ws.send(json.dumps({
+        await _send_json(ws, {
             "type": "auth",
             "token": self.config.token,
             "name": self.config.name,
-        }))
+        })
 
         raw = await asyncio.wait_for(ws.recv(), timeout=10)
-        msg = json.loads(raw)
+        msg = orjson.loads(raw)
 
         if msg.get("type") == "auth_ok":
             return True
@@ -222,21 +384,27 @@ class Bridge:
                 if isinstance(message, bytes):
                     await self._handle_binary(message)
                 else:
-                    await self._handle_json(json.loads(message))
+                    await self._handle_json(orjson.loads(message))
 
         async def session_reporter():
             while True:
-                await asyncio.sleep(self.config.session_report_interval)
                 try:
-                    sessions = await self._collect_sessions()
-                    await ws.send(json.dumps({
-                        "type": "sessions",
-                        "sessions": sessions,
-                        "sources": self._configured_sources(),
-                    }))
+                    async with asyncio.timeout(self.config.session_report_interval):
+                        await self._report_event.wait()
+                except TimeoutError:
+                    pass
+                # Cleared before collecting: a request arriving meanwhile sets
+                # it again and gets a fresh report on the next pass
+                self._report_event.clear()
+                try:
+                    await self._send_sessions(ws, await self._collect_sessions())
                 except Exception as e:
                     logger.debug("Session report failed: %s", e)
 
+        # New connection: the backend has no session list yet
+        self._last_report_digest = None
+        self._report_event.clear()
+
         # Send initial session list
         try:
             sessions = await self._collect_sessions()
@@ -249,11 +417,7 @@ class Bridge:
                         len(sessions),
                         ", ".join(f"{k}={v}" for k, v in sorted(by_src.items()))
                         if by_src else "(no sessions)")
-            await ws.send(json.dumps({
-                "type": "sessions",
-                "sessions": sessions,
-                "sources": self._configured_sources(),
-            }))
+            await self._send_sessions(ws, sessions)
         except Exception as e:
             logger.debug("Initial session report failed: %s", e)
 
@@ -267,12 +431,34 @@ class Bridge:
             except asyncio.CancelledError:
                 pass
 
+    async def _send_sessions(
+        self, ws: websockets.ClientConnection, sessions: list[dict],
+    ) -> None:
+        """Send a sessions report unless it is identical to the last one sent.
+
+        At most _REPORT_RESEND_EVERY - 1 identical reports in a row are skipped.
+        """
+        payload = orjson.dumps({
+            "type": "sessions",
+            "sessions": sessions,
+            "sources": self._configured_sources(),
+        })
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if (digest == self._last_report_digest
+                and self._reports_skipped < _REPORT_RESEND_EVERY - 1):
+            self._reports_skipped += 1
+            return
+        await ws.send(payload, text=True)
+        self._last_report_digest = digest
+        self._reports_skipped = 0
+
     async def _handle_binary(self, data: bytes) -> None:
         """Route binary frame to the correct terminal session."""
         if len(data) < 2:
             return
-        channel_id = struct.unpack(">H", data[:2])[0]
-        payload = data[2:]
+        channel_id = (data[0] << 8) | data[1]
+        # A view, so the payload is copied once: into write()'s coalescing buffer
+        payload = memoryview(data)[2:]
         terminal = self._terminals.get(channel_id)
         if terminal:
             terminal.write(payload)
@@ -280,28 +466,11 @@ class Bridge:
     async def _handle_json(self, msg: dict) -> None:
         """Handle a JSON control message from backend."""
         msg_type = msg.get("type", "")
-
-        if msg_type == "attach":
-            await self._handle_attach(msg)
-        elif msg_type == "detach":
-            await self._handle_detach(msg)
-        elif msg_type == "resize":
-            self._handle_resize(msg)
-        elif msg_type == "tmux_cmd":
-            await self._handle_tmux_cmd(msg)
-        elif msg_type == "list_sessions":
-            sessions = await self._collect_sessions()
-            await self._ws.send(json.dumps({
-                "type": "sessions",
-                "sessions": sessions,
-                "sources": self._configured_sources(),
-            }))
-        elif msg_type == "file_read":
-            await self._handle_file_read(msg)
-        elif msg_type == "ping":
-            await self._ws.send(json.dumps({"type": "pong"}))
-        else:
+        handler = self._json_handlers.get(msg_type)
+        if handler is None:
             logger.debug("Unknown message type: %s", msg_type)
+            return
+        await handler(msg)
 
     async def _handle_attach(self, msg: dict) -> None:
         """Attach to a tmux session and start a PTY."""
@@ -325,20 +494,21 @@ class Bridge:
             await terminal.start()
             terminal.resize(cols, rows)
             self._terminals[channel_id] = terminal
-            await self._ws.send(json.dumps({
-                "type": "attach_ok",
-                "id": req_id,
-                "channel_id": channel_id,
-            }))
-            logger.info("Attached ch %d to %s (source=%s)", channel_id, target, source)
-        except Exception as e:
+        except (OSError, ValueError) as e:
             logger.error("Attach failed for %s: %s", target, e)
-            await self._ws.send(json.dumps({
+            await _send_json(self._ws, {
                 "type": "attach_error",
                 "id": req_id,
                 "channel_id": channel_id,
                 "reason": str(e),
-            }))
+            })
+            return
+        await _send_json(self._ws, {
+            "type": "attach_ok",
+            "id": req_id,
+            "channel_id": channel_id,
+        })
+        logger.info("Attached ch %d to %s (source=%s)", channel_id, target, source)
 
     async def _handle_detach(self, msg: dict) -> None:
         """Detach a terminal session."""
@@ -348,7 +518,7 @@ class Bridge:
             await terminal.stop()
             logger.info("Detached ch %d", channel_id)
 
-    def _handle_resize(self, msg: dict) -> None:
+    async def _handle_resize(self, msg: dict) -> None:
         """Resize a terminal session."""
         channel_id = msg.get("channel_id", 0)
         cols = msg.get("cols", 80)
@@ -357,52 +527,88 @@ class Bridge:
         if terminal:
             terminal.resize(cols, rows)
 
+    async def _handle_list_sessions(self, msg: dict) -> None:
+        """Request a session report; coalesced into the next one sent."""
+        self._report_event.set()
+
+    async def _handle_ping(self, msg: dict) -> None:
+        """Reply to an application-level ping."""
+        await self._ws.send(_PONG_MSG, text=True)
+
     async def _handle_tmux_cmd(self, msg: dict) -> None:
         """Run a tmux command and return the result."""
         req_id = msg.get("id", "")
         cmd = msg.get("cmd", [])
         if not cmd:
-            await self._ws.send(json.dumps({
+            await _send_json(self._ws, {
                 "type": "cmd_result",
                 "id": req_id,
                 "output": "",
                 "error": "Empty command",
-            }))
+            })
             return
 
         session_name = self._extract_session_name_from_cmd(cmd)
         source = self._resolve_source(msg, session_name)
-        cmd = self._build_cmd_for_source(cmd, source)
-
+        result = await self._tmux_cmd_via_control(cmd, source)
+        if result is not None:
+            output, error = result
+        else:
+            output, error = await self._run_cmd(self._build_cmd_for_source(cmd, source))
+        await _send_json(self._ws, {
+            "type": "cmd_result",
+            "id": req_id,
+            "output": output,
+            "error": error,
+        })
+
+    async def _tmux_cmd_via_control(
+        self, cmd: list[str], source: str,
+    ) -> tuple[str, str | None] | None:
+        """Run a tmux_cmd on the source's control client, if it can take it.
+
+        Returns (output, error), or None when the command has to run as a
+        subprocess instead.
+        """
+        control = self._tmux_controls.get(source)
+        if (control is None or len(cmd) < 2 or cmd[0] != "tmux"
+                or cmd[1] not in _CONTROL_TMUX_CMDS
+                or not _TARGET_FLAGS.intersection(cmd[2:])
+                or any("\n" in a or "\r" in a for a in cmd)):
+            return None
+        try:
+            output = await control.command(quote_args(cmd[1:]), timeout=10)
+        except TmuxCommandError as e:
+            return "", str(e)
+        except TimeoutError:
+            await self._close_tmux_control(source)  # reply may still arrive
+            return "", "Command timed out"  # may have run; don't retry
+        except (TmuxControlError, OSError) as e:
+            logger.debug("tmux control command failed (source=%s): %s", source, e)
+            await self._close_tmux_control(source)
+            return None
+        return output.decode("utf-8", errors="replace"), None
+
+    async def _run_cmd(self, cmd: list[str]) -> tuple[str, str | None]:
+        """Run a command as a subprocess; returns (output, error)."""
+        output, error = "", None
         try:
             proc = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=10)
-            output = stdout.decode("utf-8", errors="replace")
-            error = stderr.decode("utf-8", errors="replace") if proc.returncode != 0 else None
-            await self._ws.send(json.dumps({
-                "type": "cmd_result",
-                "id": req_id,
-                "output": output,
-                "error": error,
-            }))
+            async with asyncio.timeout(10):
+                stdout, stderr = await proc.communicate()
         except asyncio.TimeoutError:
-            await self._ws.send(json.dumps({
-                "type": "cmd_result",
-                "id": req_id,
-                "output": "",
-                "error": "Command timed out",
-            }))
-        except Exception as e:
-            await self._ws.send(json.dumps({
-                "type": "cmd_result",
-                "id": req_id,
-                "output": "",
-                "error": str(e),
-            }))
+            error = "Command timed out"
+        except (OSError, ValueError) as e:
+            error = str(e)
+        else:
+            output = stdout.decode("utf-8", errors="replace")
+            if proc.returncode != 0:
+                error = stderr.decode("utf-8", errors="replace")
+        return output, error
 
     async def _handle_file_read(self, msg: dict) -> None:
         """Read a file and return base64-encoded content."""
@@ -414,9 +620,9 @@ class Bridge:
 
         if not file_path:
             logger.warning("file_read rejected: no path specified")
-            await self._ws.send(json.dumps({
+            await _send_json(self._ws, {
                 "type": "file_result", "id": req_id, "error": "No path specified",
-            }))
+            })
             return
 
         try:
@@ -424,21 +630,22 @@ class Bridge:
                 data, mime = await self._read_file_docker(source, file_path)
             else:
                 data, mime = await self._read_file_local(source, file_path)
-
-            encoded = base64.b64encode(data).decode("ascii")
-            logger.info("file_read success: path=%s size=%d mime=%s", file_path, len(data), mime)
-            await self._ws.send(json.dumps({
-                "type": "file_result",
-                "id": req_id,
-                "data": encoded,
-                "mime_type": mime,
-                "size": len(data),
-            }))
-        except Exception as e:
+        except (OSError, ValueError) as e:
             logger.error("file_read failed (source=%s, path=%s): %s", source, file_path, e)
-            await self._ws.send(json.dumps({
+            await _send_json(self._ws, {
                 "type": "file_result", "id": req_id, "error": str(e),
-            }))
+            })
+            return
+
+        encoded = base64.b64encode(data).decode("ascii")
+        logger.info("file_read success: path=%s size=%d mime=%s", file_path, len(data), mime)
+        await _send_json(self._ws, {
+            "type": "file_result",
+            "id": req_id,
+            "data": encoded,
+            "mime_type": mime,
+            "size": len(data),
+        })
 
     async def _read_file_local(self, source: str, file_path: str) -> tuple[bytes, str]:
         """Read a file from local or host filesystem."""
@@ -463,7 +670,8 @@ class Bridge:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
+            async with asyncio.timeout(5):
+                stdout, _ = await proc.communicate()
             mime = stdout.decode("utf-8").strip()
             if not mime or "/" not in mime:
                 mime = "application/octet-stream"
@@ -487,7 +695,8 @@ class Bridge:
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+        async with asyncio.timeout(30):
+            stdout, stderr = await proc.communicate()
         if proc.returncode != 0:
             error = stderr.decode("utf-8", errors="replace").strip()
             raise FileNotFoundError(error or f"Failed to read {file_path}")
@@ -503,7 +712,8 @@ class Bridge:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
+            async with asyncio.timeout(5):
+                stdout, _ = await proc.communicate()
             mime = stdout.decode("utf-8").strip()
             if not mime or "/" not in mime:
                 mime = "application/octet-stream"
@@ -589,28 +799,27 @@ class Bridge:
         Mirrors the backend's approach: local, host socket, docker containers.
         Each session is tagged with a 'source' field for routing.
         """
-        all_sessions: list[dict] = []
-
-        # Local tmux sessions
+        # Sources are independent (tmux subprocesses, docker API), so query
+        # them concurrently: a report takes as long as the slowest source.
+        collectors: list[tuple[str, Awaitable[list[dict]]]] = []
         if self.config.local:
-            local = await self._list_tmux_sessions([], source="local")
-            all_sessions.extend(local)
-            logger.info("Local: %d sessions", len(local))
-
-        # Host tmux socket sessions
-        if self.config.host_tmux_socket and not self._host_socket_broken:
-            host = await self._list_tmux_sessions(
-                ["-S", self.config.host_tmux_socket],
-                source="host",
-            )
-            all_sessions.extend(host)
-            logger.info("Host: %d sessions", len(host))
-
-        # Docker container tmux sessions
+            collectors.append(("Local", self._list_tmux_sessions([], source="local")))
+        if self.config.host_tmux_socket:
+            collectors.append(("Host", self._list_host_sessions()))
         if self.config.docker_socket:
-            docker = await self._collect_docker_sessions()
-            all_sessions.extend(docker)
-            logger.info("Docker: %d sessions", len(docker))
+            collectors.append(("Docker", self._collect_docker_sessions()))
+
+        results = await asyncio.gather(
+            *(collector for _, collector in collectors), return_exceptions=True,
+        )
+
+        all_sessions: list[dict] = []
+        for (label, _), result in zip(collectors, results):
+            if isinstance(result, BaseException):
+                logger.warning("%s session collection failed: %s", label, result)
+                continue
+            all_sessions.extend(result)
+            logger.info("%s: %d sessions", label, len(result))
 
         # Rebuild session→source lookup caches
         self._id_to_source = {}
@@ -622,46 +831,110 @@ class Bridge:
 
         return all_sessions
 
+    async def _list_host_sessions(self) -> list[dict]:
+        """List host tmux sessions, re-probing the socket if it was marked broken."""
+        sock_path = self.config.host_tmux_socket
+        if self._host_socket_broken:
+            if not await self._test_socket_connectable(sock_path):
+                return []
+            logger.info("Host tmux socket CONNECTABLE again: %s", sock_path)
+            self._host_socket_broken = False
+            self._sources_cache = None
+        return await self._list_tmux_sessions(["-S", sock_path], source="host")
+
+    async def _tmux_query(self, extra_args: list[str], args: list[str], source: str) -> bytes:
+        """Run a read-only tmux command and return its stdout.
+
+        Goes through the source's control-mode client when one is running,
+        which avoids spawning a tmux client per query; otherwise (or if the
+        control client fails) runs tmux as a subprocess.
+        """
+        control = self._tmux_controls.get(source)
+        if control is not None:
+            try:
+                return await control.command(quote_args(args))
+            except TmuxCommandError as e:
+                logger.debug("tmux query failed (source=%s): %s", source, e)
+                return b""  # as a failed subprocess would (stdout empty)
+            except (TmuxControlError, TimeoutError, OSError) as e:
+                logger.debug("tmux control query failed (source=%s): %s", source, e)
+                await self._close_tmux_control(source)
+
+        proc = await asyncio.create_subprocess_exec(
+            "tmux", *extra_args, *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        async with asyncio.timeout(5):
+            stdout, _ = await proc.communicate()
+        return stdout
+
+    async def _start_tmux_control(self, extra_args: list[str], source: str) -> None:
+        control = TmuxControlClient(extra_args)
+        try:
+            await control.start()
+        except (TmuxControlError, TimeoutError, OSError) as e:
+            # Don't retry on every report; use subprocesses until reconnect
+            logger.info("tmux control client failed to start (source=%s): %s", source, e)
+            self._tmux_control_failed.add(source)
+            return
+        self._tmux_controls[source] = control
+
+    async def _close_tmux_control(self, source: str) -> None:
+        control = self._tmux_controls.pop(source, None)
+        if control is not None:
+            await control.close()
+
     async def _list_tmux_sessions(
         self, extra_args: list[str], source: str = "local",
     ) -> list[dict]:
-        """List tmux sessions using tmux list-sessions + list-windows."""
-        cmd = ["tmux"] + extra_args + [
-            "list-sessions", "-F",
-            "#{session_name}|#{session_windows}|#{session_created}|#{session_attached}",
-        ]
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
-        except (asyncio.TimeoutError, FileNotFoundError, OSError) as e:
-            logger.warning("tmux list-sessions failed (source=%s): %s", source, e)
+        """List tmux sessions using tmux list-sessions + one list-windows -a."""
+        # Both queries are independent; run them side by side. The windows
+        # query handles its own errors, so only the sessions result can raise.
+        stdout, windows_by_session = await asyncio.gather(
+            self._tmux_query(extra_args, ["list-sessions", "-F", _SESSION_FORMAT], source),
+            self._list_tmux_windows(extra_args, source),
+            return_exceptions=True,
+        )
+        if isinstance(stdout, (asyncio.TimeoutError, FileNotFoundError, OSError)):
+            logger.warning("tmux list-sessions failed (source=%s): %s", source, stdout)
             return []
+        if isinstance(stdout, BaseException):
+            raise stdout
+
+        matches = list(_SESSION_LINE_RE.finditer(stdout))
+        # Before (re)starting it below: a client started now isn't in stdout
+        control = self._tmux_controls.get(source)
+        control_session = control.session_name if control is not None else None
+
+        # The control client attaches to an existing session, so it can only
+        # run while there is one (tmux detaches it when its session goes away).
+        if (
+            matches
+            and self.config.tmux_control
+            and source not in self._tmux_controls
+            and source not in self._tmux_control_failed
+        ):
+            await self._start_tmux_control(extra_args, source)
+        elif not matches and source in self._tmux_controls:
+            await self._close_tmux_control(source)
 
         sessions = []
-        for line in stdout.decode("utf-8", errors="replace").strip().splitlines():
-            line = line.strip()
-            if not line or "|" not in line:
-                continue
-            parts = line.split("|")
-            if len(parts) < 4:
-                continue
-            name = parts[0]
+        for m in matches:
+            name = m[1].decode("utf-8", errors="replace")
             try:
-                created_ts = int(parts[2])
+                created_ts = int(m[2])
                 created = datetime.fromtimestamp(created_ts, tz=UTC).isoformat()
             except (ValueError, OSError):
                 created = datetime.now(UTC).isoformat()
-            attached = parts[3] == "1"
+            clients = int(m[3]) if m[3].isdigit() else 0
+            if name == control_session:
+                clients -= 1  # our own control client is not a user
+            attached = clients == 1
 
-            windows = await self._list_tmux_windows(extra_args, name)
+            windows = windows_by_session.get(name, [])
 
-            session_id = hashlib.md5(
-                f"bridge:{source}:{name}".encode()
-            ).hexdigest()[:12]
+            session_id = _session_id(source, name)
 
             sessions.append({
                 "id": session_id,
@@ -673,41 +946,33 @@ class Bridge:
             })
         return sessions
 
-    async def _list_tmux_windows(self, extra_args: list[str], session_name: str) -> list[dict]:
-        """List windows for a tmux session."""
-        cmd = ["tmux"] + extra_args + [
-            "list-windows", "-t", session_name, "-F",
-            "#{window_index}|#{window_name}|#{window_active}|#{window_panes}|#{window_bell_flag}|#{window_activity_flag}|#{pane_current_command}|#{@pane_status}",
-        ]
+    async def _list_tmux_windows(
+        self, extra_args: list[str], source: str = "local",
+    ) -> dict[str, list[dict]]:
+        """List the windows of every tmux session in one call, keyed by session name."""
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            stdout = await self._tmux_query(
+                extra_args, ["list-windows", "-a", "-F", _WINDOW_FORMAT], source,
             )
-            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
         except (asyncio.TimeoutError, FileNotFoundError, OSError):
-            return []
+            return {}
 
-        windows = []
-        for line in stdout.decode("utf-8", errors="replace").strip().splitlines():
-            line = line.strip()
-            if not line or "|" not in line:
-                continue
-            parts = line.split("|")
-            if len(parts) < 4:
-                continue
-            windows.append({
-                "index": int(parts[0]) if parts[0].isdigit() else 0,
-                "name": parts[1],
-                "active": parts[2] == "1",
-                "panes": int(parts[3]) if parts[3].isdigit() else 1,
-                "bell": parts[4] == "1" if len(parts) > 4 else False,
-                "activity": parts[5] == "1" if len(parts) > 5 else False,
-                "command": parts[6] if len(parts) > 6 else "",
-                "pane_status": parts[7] if len(parts) > 7 else "",
+        by_session: dict[str, list[dict]] = {}
+        for m in _WINDOW_LINE_RE.finditer(stdout):
+            index, name, active, panes, bell, activity, command, pane_status = m.group(
+                2, 3, 4, 5, 6, 7, 8, 9,
+            )
+            by_session.setdefault(m[1].decode("utf-8", errors="replace"), []).append({
+                "index": int(index) if index.isdigit() else 0,
+                "name": name.decode("utf-8", errors="replace"),
+                "active": active == b"1",
+                "panes": int(panes) if panes.isdigit() else 1,
+                "bell": bell == b"1",
+                "activity": activity == b"1",
+                "command": command.decode("utf-8", errors="replace"),
+                "pane_status": pane_status.decode("utf-8", errors="replace"),
             })
-        return windows
+        return by_session
 
     async def _collect_docker_sessions(self) -> list[dict]:
         """Collect tmux sessions from Docker containers.
@@ -717,9 +982,7 @@ class Bridge:
         if not self.config.docker_socket:
             return []
 
-        try:
-            import docker as docker_lib
-        except ImportError:
+        if docker_lib is None:
             # Only warn once — this method is called every report interval
             if not getattr(self, "_docker_import_warned", False):
                 logger.warning("docker package not installed — install with: "
@@ -728,60 +991,69 @@ class Bridge:
             return []
 
         try:
-            client = docker_lib.DockerClient(
-                base_url=f"unix://{self.config.docker_socket}"
-            )
-            filters = {}
-            if self.config.docker_label:
-                filters["label"] = self.config.docker_label
-            containers = client.containers.list(filters=filters)
+            # docker-py is blocking; keep its HTTP round-trip off the event loop
+            containers = await asyncio.to_thread(self._list_docker_containers)
         except Exception as e:
             logger.debug("Docker list failed: %s", e)
+            self._close_docker_client()  # reconnect on the next report
             return []
 
-        all_sessions: list[dict] = []
-        for container in containers:
-            source = f"docker:{container.short_id}"
+        results = await asyncio.gather(
+            *(self._list_container_sessions(container) for container in containers)
+        )
+        return [session for sessions in results for session in sessions]
+
+    def _list_docker_containers(self) -> list:
+        """List running containers (blocking; called in a worker thread)."""
+        # Reuse one client (and its socket connection) across reports
+        if self._docker_client is None:
+            self._docker_client = docker_lib.DockerClient(
+                base_url=f"unix://{self.config.docker_socket}"
+            )
+        filters = {}
+        if self.config.docker_label:
+            filters["label"] = self.config.docker_label
+        return self._docker_client.containers.list(filters=filters)
+
+    async def _list_container_sessions(self, container) -> list[dict]:
+        """List tmux sessions inside one Docker container."""
+        source = f"docker:{container.short_id}"
+        sessions: list[dict] = []
+        try:
+            # docker-py and the /proc probe block; run them in a worker thread
+            # so containers overlap
+            stdout = await asyncio.to_thread(_exec_list_sessions, container)
+            for m in _SESSION_LINE_RE.finditer(stdout):
+                name = m[1].decode("utf-8", errors="replace")
+                try:
+                    created_ts = int(m[2])
+                    created = datetime.fromtimestamp(created_ts, tz=UTC).isoformat()
+                except (ValueError, OSError):
+                    created = datetime.now(UTC).isoformat()
+                attached = m[3] == b"1"
+
+                session_id = _session_id(source, name)
+
+                sessions.append({
+                    "id": session_id,
+                    "name": name,
+                    "source": source,
+                    "windows": [],  # skip windows for docker discovery to keep it fast
+                    "created": created,
+                    "attached": attached,
+                })
+        except Exception as e:
+            logger.debug("Docker container %s tmux list failed: %s", container.short_id, e)
+        return sessions
+
+    def _close_docker_client(self) -> None:
+        """Drop the cached Docker client so the next report reconnects."""
+        if self._docker_client is not None:
             try:
-                result = container.exec_run(
-                    ["tmux", "list-sessions", "-F",
-                     "#{session_name}|#{session_windows}|#{session_created}|#{session_attached}"],
-                    demux=True,
-                )
-                if result.exit_code != 0:
-                    continue
-                stdout = result.output[0] if result.output[0] else b""
-                for line in stdout.decode("utf-8", errors="replace").strip().splitlines():
-                    line = line.strip()
-                    if not line or "|" not in line:
-                        continue
-                    parts = line.split("|")
-                    if len(parts) < 4:
-                        continue
-                    name = parts[0]
-                    try:
-                        created_ts = int(parts[2])
-                        created = datetime.fromtimestamp(created_ts, tz=UTC).isoformat()
-                    except (ValueError, OSError):
-                        created = datetime.now(UTC).isoformat()
-                    attached = parts[3] == "1"
-
-                    session_id = hashlib.md5(
-                        f"bridge:{source}:{name}".encode()
-                    ).hexdigest()[:12]
-
-                    all_sessions.append({
-                        "id": session_id,
-                        "name": name,
-                        "source": source,
-                        "windows": [],  # skip windows for docker discovery to keep it fast
-                        "created": created,
-                        "attached": attached,
-                    })
+                self._docker_client.close()
             except Exception as e:
-                logger.debug("Docker container %s tmux list failed: %s", container.short_id, e)
-
-        return all_sessions
+                logger.debug("Docker client close failed: %s", e)
+            self._docker_client = None
 
     async def _cleanup_terminals(self) -> None:
         """Stop all terminal sessions."""
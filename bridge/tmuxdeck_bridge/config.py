@@ -19,6 +19,7 @@ class BridgeConfig:
     docker_label: str = ""  # docker label filter for containers
     ipv6: bool = False  # use IPv6 instead of IPv4
     session_report_interval: float = 5.0
+    tmux_control: bool = False  # query local/host tmux through a tmux -C client
     reconnect_min: float = 5.0
     reconnect_max: float = 60.0
 
@@ -63,6 +64,11 @@ def parse_config() -> BridgeConfig:
         "--report-interval", type=float, default=5.0,
         help="Session report interval in seconds (default: 5)",
     )
+    parser.add_argument(
+        "--tmux-control", action="store_true",
+        help="Query local/host tmux through a control-mode (tmux -C) client attached "
+             "to an existing session, instead of spawning tmux per query (tmux >= 3.2)",
+    )
 
     args = parser.parse_args()
 
@@ -83,4 +89,5 @@ def parse_config() -> BridgeConfig:
         docker_label=args.docker_label or os.environ.get("DOCKER_LABEL", ""),
         ipv6=args.ipv6,
         session_report_interval=args.report_interval,
+        tmux_control=args.tmux_control,
     )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import fcntl
+import functools
 import logging
 import os
 import pty
@@ -17,6 +18,32 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Terminal input is coalesced for up to this long before hitting the PTY...
+_WRITE_FLUSH_DELAY = 0.001
+# ...unless this much is already queued.
+_WRITE_HIGH_WATER = 64 * 1024
+# Max PTY output per read, and so per WebSocket frame
+_READ_SIZE = 64 * 1024
+
+
+@functools.cache
+def _child_env() -> dict[str, str]:
+    """Environment for PTY children, built once (the bridge never changes its own)."""
+    env = os.environ.copy()
+    env.pop("TMUX", None)
+    env["TERM"] = "xterm-256color"
+    return env
+
+
+async def _wait_readable(loop: asyncio.AbstractEventLoop, fd: int) -> None:
+    """Wait until fd is readable, without keeping a reader registered."""
+    ready = loop.create_future()
+    loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+    try:
+        await ready
+    finally:
+        loop.remove_reader(fd)
+
 
 class TerminalSession:
     """Manages a single PTY running tmux attach, connected to a bridge channel."""
@@ -33,14 +60,14 @@ class TerminalSession:
         self._master_fd: int | None = None
         self._proc: asyncio.subprocess.Process | None = None
         self._task: asyncio.Task | None = None
+        self._wbuf = bytearray()  # pending PTY input, see write()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._waiting_writable = False  # PTY input queue full, add_writer pending
 
     async def start(self) -> None:
         """Spawn the PTY process and start the read loop."""
-        env = os.environ.copy()
-        env.pop("TMUX", None)
-        env["TERM"] = "xterm-256color"
-
         master_fd, slave_fd = pty.openpty()
+        os.set_blocking(master_fd, False)  # read/written from the event loop
         self._master_fd = master_fd
 
         self._proc = await asyncio.create_subprocess_exec(
@@ -48,7 +75,7 @@ class TerminalSession:
             stdin=slave_fd,
             stdout=slave_fd,
             stderr=slave_fd,
-            env=env,
+            env=_child_env(),  # only read; subprocess builds the child's copy
         )
         os.close(slave_fd)
 
@@ -56,26 +83,76 @@ class TerminalSession:
 
     async def _read_loop(self) -> None:
         """Read from PTY and send binary frames with channel header to backend."""
-        loop = asyncio.get_event_loop()
-        header = struct.pack(">H", self.channel_id)
+        loop = asyncio.get_running_loop()
+        fd = self._master_fd
+        # One frame buffer for the session: channel header written once, PTY
+        # output read straight in after it. ws.send masks (copies) the frame
+        # before returning, so the buffer is free again for the next read.
+        frame = memoryview(bytearray(2 + _READ_SIZE))
+        frame[:2] = self.channel_id.to_bytes(2, "big")
+        payload = [frame[2:]]
         try:
             while True:
-                data = await loop.run_in_executor(None, os.read, self._master_fd, 4096)
-                if not data:
+                try:
+                    n = os.readv(fd, payload)
+                except BlockingIOError:
+                    await _wait_readable(loop, fd)
+                    continue
+                if not n:
                     break
-                await self._ws.send(header + data)
+                await self._ws.send(frame[:2 + n])
+                # ws.send only suspends when the transport is over its write
+                # limit; yield anyway so a PTY that always has output can't
+                # starve other channels.
+                await asyncio.sleep(0)
         except OSError:
             pass
         except Exception as e:
             logger.debug("Terminal read loop error (ch %d): %s", self.channel_id, e)
 
-    def write(self, data: bytes) -> None:
-        """Write data to the PTY (terminal input from user)."""
-        if self._master_fd is not None:
-            try:
-                os.write(self._master_fd, data)
-            except OSError:
-                pass
+    def write(self, data: bytes | memoryview) -> None:
+        """Write data to the PTY (terminal input from user).
+
+        Writes are buffered for up to 1 ms so a burst of frames (e.g. a
+        paste) becomes one os.write instead of one per frame.
+        """
+        if self._master_fd is None:
+            return
+        self._wbuf += data
+        if len(self._wbuf) >= _WRITE_HIGH_WATER:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                _WRITE_FLUSH_DELAY, self._flush,
+            )
+
+    def _flush(self) -> None:
+        """Write buffered input to the PTY."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        fd = self._master_fd
+        if fd is None:
+            self._wbuf.clear()
+            return
+        try:
+            while self._wbuf:
+                written = os.write(fd, self._wbuf)
+                del self._wbuf[:written]
+        except BlockingIOError:
+            # PTY input queue is full: finish once the fd is writable again
+            if not self._waiting_writable:
+                asyncio.get_running_loop().add_writer(fd, self._flush)
+                self._waiting_writable = True
+            return
+        except OSError:
+            self._wbuf.clear()
+        self._stop_waiting_writable()
+
+    def _stop_waiting_writable(self) -> None:
+        if self._waiting_writable:
+            asyncio.get_running_loop().remove_writer(self._master_fd)
+            self._waiting_writable = False
 
     def resize(self, cols: int, rows: int) -> None:
         """Resize the PTY."""
@@ -96,6 +173,8 @@ class TerminalSession:
                 await self._task
             except (asyncio.CancelledError, Exception):
                 pass
+        self._flush()
+        self._stop_waiting_writable()
         if self._master_fd is not None:
             try:
                 os.close(self._master_fd)
@@ -0,0 +1,147 @@
+"""Persistent tmux control-mode client (tmux -C) for querying a tmux server."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class TmuxControlError(Exception):
+    """The control client failed a command or went away."""
+
+
+class TmuxCommandError(TmuxControlError):
+    """tmux ran the command and replied with %error."""
+
+
+def quote_args(args: list[str]) -> str:
+    """Join args into one tmux command line, each single-quoted.
+
+    tmux does no expansion inside single quotes; an embedded ' is closed,
+    escaped and reopened as in sh. Newlines can't be sent this way.
+    """
+    return " ".join("'" + a.replace("'", "'\\''") + "'" for a in args)
+
+
+class TmuxControlClient:
+    """One long-lived `tmux -C` process that runs commands over stdin.
+
+    Each command's reply arrives on stdout framed by %begin / %end (or
+    %error) lines. The client attaches to an existing session (tmux
+    picks the most recent one) with ignore-size and no-output, so it
+    neither resizes windows nor receives pane output; it creates and
+    destroys nothing on the server. It does count as a client of that
+    session: session_name tracks which one, from %session-changed and
+    %session-renamed notifications.
+    """
+
+    def __init__(self, extra_args: list[str]) -> None:
+        self._extra_args = extra_args
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+        self._broken = False  # a reply was left unread; see command()
+        self._session_id: bytes | None = None  # tmux session id, e.g. b"$3"
+        self.session_name: str | None = None  # session this client is attached to
+
+    async def start(self) -> None:
+        """Spawn the control client and wait for it to attach.
+
+        Needs a server with at least one session, and tmux >= 3.2 for the
+        attach-session -f flags.
+        """
+        env = os.environ.copy()
+        env.pop("TMUX", None)
+        self._proc = await asyncio.create_subprocess_exec(
+            "tmux", *self._extra_args, "-C",
+            "attach-session", "-f", "ignore-size,no-output",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=env,
+        )
+        try:
+            async with asyncio.timeout(5):
+                await self._read_reply()  # reply to attach-session itself
+            # Its %session-changed only arrives before the next reply; ask
+            # instead, so session_name is known as soon as start() returns.
+            reply = await self.command("display-message -p '#{session_id} #{session_name}'")
+        except (TmuxControlError, TimeoutError):
+            await self.close()
+            raise
+        self._session_id, _, name = reply.rstrip(b"\n").partition(b" ")
+        self.session_name = name.decode("utf-8", errors="replace")
+
+    async def command(self, line: str, timeout: float = 5) -> bytes:
+        """Run one tmux command line and return its output."""
+        async with self._lock:
+            # Checked under the lock: a concurrent caller may have closed it
+            if self._proc is None or self._proc.returncode is not None or self._broken:
+                raise TmuxControlError("tmux control client is not running")
+            try:
+                self._proc.stdin.write(line.encode() + b"\n")
+                await self._proc.stdin.drain()
+                async with asyncio.timeout(timeout):
+                    return await self._read_reply()
+            except TmuxCommandError:
+                raise  # reply fully read; the client is still in step
+            except BaseException:
+                # Timed out, cancelled or broken mid-reply: what is left of
+                # this reply would be read as the next command's. Detach.
+                self._abandon()
+                raise
+
+    def _abandon(self) -> None:
+        """Refuse further commands and start detaching; close() reaps it."""
+        self._broken = True
+        proc = self._proc
+        if proc is not None and proc.returncode is None:
+            proc.stdin.close()
+
+    async def _read_reply(self) -> bytes:
+        stdout = self._proc.stdout  # close() may drop self._proc meanwhile
+        out: list[bytes] = []
+        guard = None  # "<time> <number> <flags>\n" from %begin
+        while True:
+            line = await stdout.readline()
+            if not line:
+                raise TmuxControlError("tmux control client exited")
+            if guard is None:
+                if line.startswith(b"%begin "):
+                    guard = line[7:]
+                else:
+                    self._notification(line)
+                continue
+            # Output is not escaped: a pane line may itself read "%end ...",
+            # so only the guard line carrying %begin's arguments ends it.
+            if line.startswith(b"%end ") and line[5:] == guard:
+                return b"".join(out)
+            if line.startswith(b"%error ") and line[7:] == guard:
+                raise TmuxCommandError(b"".join(out).decode("utf-8", errors="replace").strip())
+            out.append(line)
+
+    def _notification(self, line: bytes) -> None:
+        """Track the attached session; other notifications are ignored."""
+        kind, _, rest = line.rstrip(b"\n").partition(b" ")
+        session_id, _, name = rest.partition(b" ")
+        if kind == b"%session-changed" or (
+                kind == b"%session-renamed" and session_id == self._session_id):
+            self._session_id = session_id
+            self.session_name = name.decode("utf-8", errors="replace")
+
+    async def close(self) -> None:
+        """Detach the control client (closing its stdin ends control mode)."""
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        proc.stdin.close()
+        try:
+            async with asyncio.timeout(2):
+                await proc.wait()
+        except TimeoutError:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
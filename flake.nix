@@ -48,6 +48,7 @@
           mypy
           pytest
           pytest-asyncio
+          pytest-xdist
           httpx
         ]);
 